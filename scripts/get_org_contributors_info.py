@@ -5,15 +5,39 @@ Note:
     information.
 """
 
+import asyncio
+import dataclasses
 import datetime
-import json
 import os
-from typing import Dict, List
+import sqlite3
+import tempfile
+import time
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, parse_qsl, urlencode, urlsplit
 
-from github import Github
-from github.GithubException import GithubException
+import aiohttp
+import orjson
 
 FILE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(FILE_DIR, ".cache")
+REPO_CACHE_DIR = os.path.join(CACHE_DIR, "repos")
+REPO_CACHE_VERSION = 2  # Bump when the repository snapshot format changes.
+# Keys every contributor entry of a repository snapshot must contain.
+REPO_SNAPSHOT_KEYS = {
+    "login",
+    "type",
+    "node_id",
+    "avatar_url",
+    "contributions",
+    "weeks",
+}
+REST_API_URL = "https://api.github.com"
+GRAPHQL_URL = "https://api.github.com/graphql"
+MAX_CONCURRENCY = 10  # Maximum number of concurrent GitHub API requests.
+CACHE_TTL = 12 * 60 * 60  # Seconds before cached responses are revalidated.
+GRAPHQL_BATCH_SIZE = 100  # Number of aliased selections per GraphQL query.
+SECONDARY_RATE_LIMIT_DELAY = 60.0  # Seconds to back off without Retry-After.
+STATS_MAX_RETRIES = 6  # Attempts while GitHub computes repository statistics.
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 ORG_NAME = os.getenv("ORG_NAME")
@@ -33,9 +57,8 @@ if not GITHUB_TOKEN:
 if not ORG_NAME:
     raise ValueError("ORG_NAME environment variable not set")
 
-github_client = Github(GITHUB_TOKEN)
-
 
+@dataclasses.dataclass(slots=True)
 class ContributorInfo:
     """A class to represent information about a GitHub contributor.
 
@@ -53,29 +76,17 @@ class ContributorInfo:
         yearly_contributions: The number of contributions in the last year.
     """
 
-    def __init__(
-        self,
-        login: str,
-        name: str,
-        avatar_url: str,
-        location: str,
-        company: str,
-        bio: str,
-        blog_url: str,
-        twitter_username: str,
-        org_member: bool,
-    ):
-        self.login = login
-        self.name = name
-        self.avatar_url = avatar_url
-        self.location = location
-        self.company = company
-        self.bio = bio
-        self.blog_url = blog_url
-        self.twitter_username = twitter_username
-        self.org_member = org_member
-        self.contributions = 0
-        self.yearly_contributions = 0
+    login: str
+    name: str
+    avatar_url: str
+    location: str
+    company: str
+    bio: str
+    blog_url: str
+    twitter_username: str
+    org_member: bool
+    contributions: int = 0
+    yearly_contributions: int = 0
 
     def add_contributions(self, contributions: int):
         """Adds contributions to the contributor.
@@ -93,159 +104,757 @@ class ContributorInfo:
         """
         self.yearly_contributions += contributions
 
-    def to_dict(self) -> Dict[str, any]:
-        """Returns a dictionary representation of the object."""
-        return {
-            "login": self.login,
-            "name": self.name,
-            "avatar_url": self.avatar_url,
-            "location": self.location,
-            "company": self.company,
-            "bio": self.bio,
-            "blog_url": self.blog_url,
-            "twitter_username": self.twitter_username,
-            "org_member": self.org_member,
-            "contributions": self.contributions,
-            "yearly_contributions": self.yearly_contributions,
-        }
-
 
 def save_to_json(data: Dict[str, any], filename: str):
     """Saves data to a JSON file.
 
+    Note:
+        The data is written to a temporary file that then replaces the target, so
+        an interrupted run never leaves a truncated file behind.
+
     Args:
         data: The data to save.
         filename: The name of the file to save the data to.
     """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    content = memoryview(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename))
+    try:
+        try:
+            os.fchmod(fd, 0o644)
+            while content:
+                content = content[os.write(fd, content) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
+
+
+class GHRateLimiter:
+    """A token bucket tracking a GitHub API rate-limit budget.
+
+    Note:
+        The bucket holds the number of requests GitHub reports as remaining in the
+        ``X-RateLimit-Remaining`` header and is refilled when the budget resets at
+        ``X-RateLimit-Reset``. Requests are therefore only delayed once the budget
+        is exhausted or GitHub asks to back off. Until the first response arrives
+        the budget is unknown and no tokens are withheld.
+
+    Attributes:
+        tokens: The number of requests left in the budget, or ``None`` if unknown.
+        reset_at: The epoch time at which the budget resets.
+        resume_at: The epoch time before which no tokens are handed out.
+        lock: The lock serializing token requests.
+    """
 
+    def __init__(self):
+        self.tokens: Optional[int] = None
+        self.reset_at = 0.0
+        self.resume_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def pause(self, delay: float):
+        """Stops handing out tokens for the given number of seconds.
+
+        Args:
+            delay: The number of seconds to pause for.
+        """
+        self.resume_at = max(self.resume_at, time.time() + delay)
+
+    def update(self, headers: Mapping[str, str]):
+        """Synchronizes the bucket with the rate-limit headers of a response.
+
+        Args:
+            headers: The headers of the response.
+        """
+        if "X-RateLimit-Remaining" not in headers or "X-RateLimit-Reset" not in headers:
+            return
+        remaining = int(headers["X-RateLimit-Remaining"])
+        reset_at = float(headers["X-RateLimit-Reset"])
+        if self.tokens is None or reset_at > self.reset_at:
+            self.tokens, self.reset_at = remaining, reset_at
+        elif reset_at == self.reset_at:
+            # Responses of concurrent requests may arrive out of order.
+            self.tokens = min(self.tokens, remaining)
+
+    async def wait_for_token(self, spend: bool = True):
+        """Waits until requests are allowed and takes a token from the bucket.
+
+        Args:
+            spend: Whether the request counts against the budget. Conditional
+                requests only wait for pauses since ``304`` responses are free.
+        """
+        async with self.lock:
+            while True:
+                now = time.time()
+                if now < self.resume_at:
+                    await asyncio.sleep(self.resume_at - now)
+                    continue
+                if not spend or self.tokens is None:
+                    return
+                if self.tokens > 0:
+                    self.tokens -= 1
+                    return
+                if now < self.reset_at:
+                    print(
+                        "GitHub rate limit exhausted, waiting "
+                        f"{self.reset_at - now + 1:.0f} seconds for it to reset..."
+                    )
+                    await asyncio.sleep(self.reset_at - now + 1)
+                    continue
+                self.tokens = None  # Budget was reset, resync from the next response.
+                return
+
+
+def get_rate_limit_delay(
+    status: int, headers: Mapping[str, str], body: bytes
+) -> Optional[float]:
+    """Retrieves how long to wait before retrying a rate-limited request.
+
+    Args:
+        status: The HTTP status code of the response.
+        headers: The headers of the response.
+        body: The body of the response.
+
+    Returns:
+        The number of seconds to wait, or ``None`` if the rate limit was not hit.
+    """
+    if status not in (403, 429):
+        return None
+    if "Retry-After" in headers:
+        return float(headers["Retry-After"])
+    if headers.get("X-RateLimit-Remaining") == "0":
+        return max(float(headers["X-RateLimit-Reset"]) - time.time(), 0) + 1
+    if status == 429 or b"secondary rate limit" in body.lower():
+        return SECONDARY_RATE_LIMIT_DELAY
+    return None
+
+
+class GitHubClient:
+    """A minimal asynchronous GitHub API client.
+
+    Note:
+        All requests share a single HTTP session and are bounded by a semaphore so
+        that network round trips overlap without flooding the API, and by token
+        buckets tracking GitHub's REST and GraphQL rate limits. REST responses
+        are cached on disk together with their ``ETag`` so that stale entries are
+        revalidated with conditional requests, which GitHub answers with a
+        ``304 Not Modified`` that does not count against the rate limit.
+
+    Attributes:
+        token: The GitHub token used to authenticate requests.
+        cache_path: The path of the SQLite response cache.
+        semaphore: The semaphore limiting the number of concurrent requests.
+        rest_limiter: The token bucket tracking the REST API rate limit.
+        graphql_limiter: The token bucket tracking the GraphQL API rate limit.
+        session: The HTTP session used for all requests.
+        cache: The connection to the SQLite response cache.
+    """
 
-def get_public_org_members(org_name: str) -> List[str]:
+    def __init__(
+        self,
+        token: str,
+        cache_path: str = os.path.join(CACHE_DIR, "gh_cache.sqlite"),
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        self.token = token
+        self.cache_path = cache_path
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rest_limiter = GHRateLimiter()
+        self.graphql_limiter = GHRateLimiter()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.cache: Optional[sqlite3.Connection] = None
+
+    async def __aenter__(self) -> "GitHubClient":
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        self.cache = sqlite3.connect(self.cache_path)
+        self.cache.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, etag TEXT, links TEXT, body BLOB, fetched_at REAL)"
+        )
+        self.session = aiohttp.ClientSession(
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Accept": "application/vnd.github+json",
+            }
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.cache.commit()
+        self.cache.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        limiter: GHRateLimiter,
+        conditional: bool = False,
+        **kwargs,
+    ) -> Tuple[int, Mapping[str, str], Dict[str, str], bytes]:
+        """Sends a request to the GitHub API, waiting out rate limits.
+
+        Note:
+            Responses that hit the primary or secondary rate limit pause all
+            requests sharing the limiter until GitHub allows new ones and are
+            then retried.
+
+        Args:
+            method: The HTTP method of the request.
+            url: The absolute URL of the request.
+            limiter: The token bucket tracking the rate limit of the request.
+            conditional: Whether the request is a conditional request, which does
+                not count against the rate limit when answered with ``304``.
+            **kwargs: Additional arguments passed to ``aiohttp``.
+
+        Returns:
+            A tuple containing the status code, the headers, a dictionary mapping
+            ``Link`` header relations to URLs and the body of the response.
+        """
+        while True:
+            await limiter.wait_for_token(spend=not conditional)
+            async with self.semaphore:
+                async with self.session.request(method, url, **kwargs) as response:
+                    body = await response.read()
+                    limiter.update(response.headers)
+                    delay = get_rate_limit_delay(
+                        response.status, response.headers, body
+                    )
+                    if delay is None:
+                        response.raise_for_status()
+                        links = {
+                            str(rel): str(link["url"])
+                            for rel, link in response.links.items()
+                        }
+                        return response.status, response.headers, links, body
+            print(f"GitHub rate limit hit, retrying in {delay:.0f} seconds...")
+            limiter.pause(delay)
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, any]] = None
+    ) -> Tuple[any, Dict[str, str]]:
+        """Sends a GET request to the GitHub REST API.
+
+        Args:
+            url: The API path (e.g. ``/orgs/{org}/repos``) or absolute URL.
+            params: The query parameters to send.
+
+        Returns:
+            A tuple containing the decoded response body (``None`` for empty
+            responses) and a dictionary mapping ``Link`` header relations to URLs.
+        """
+        if url.startswith("/"):
+            url = f"{REST_API_URL}{url}"
+        if params:
+            parts = urlsplit(url)
+            query = urlencode({**dict(parse_qsl(parts.query)), **params})
+            url = parts._replace(query=query).geturl()
+        cached = self.cache.execute(
+            "SELECT etag, links, body, fetched_at FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if cached and time.time() - cached[3] < CACHE_TTL:
+            return orjson.loads(cached[2]), orjson.loads(cached[1])
+
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        status, response_headers, links, body = await self.request(
+            "GET", url, self.rest_limiter, conditional=bool(cached), headers=headers
+        )
+        if status == 304:
+            self.cache.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            )
+            return orjson.loads(cached[2]), orjson.loads(cached[1])
+
+        if status == 200 and "ETag" in response_headers:
+            self.cache.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (url, response_headers["ETag"], orjson.dumps(links), body, time.time()),
+            )
+        return (orjson.loads(body) if body else None), links
+
+    async def get_all_pages(
+        self, url: str, params: Optional[Dict[str, any]] = None
+    ) -> List[Dict[str, any]]:
+        """Retrieves all items of a paginated GitHub REST API list.
+
+        Note:
+            The page count is taken from the ``last`` relation of the ``Link``
+            header of the first page, after which all remaining pages are
+            retrieved concurrently.
+
+        Args:
+            url: The API path or absolute URL of the list.
+            params: The query parameters to send.
+
+        Returns:
+            The items of all pages.
+        """
+        params = {"per_page": 100, **(params or {})}
+        items, links = await self.get(url, params)
+        items = items or []
+        last_page = (
+            int(parse_qs(urlsplit(links["last"]).query)["page"][0])
+            if "last" in links
+            else 1
+        )
+        pages = await asyncio.gather(
+            *[
+                self.get(url, {**params, "page": page})
+                for page in range(2, last_page + 1)
+            ]
+        )
+        for page, _ in pages:
+            items.extend(page or [])
+        return items
+
+    async def graphql(self, query: str) -> Dict[str, any]:
+        """Runs a query against the GitHub GraphQL API.
+
+        Args:
+            query: The GraphQL query to run.
+
+        Returns:
+            The data returned by the query. Selections that could not be resolved
+            are set to ``None``.
+
+        Raises:
+            RuntimeError: If the query failed for another reason than selections
+                that could not be found.
+        """
+        while True:
+            _, headers, _, body = await self.request(
+                "POST", GRAPHQL_URL, self.graphql_limiter, json={"query": query}
+            )
+            response = orjson.loads(body)
+            errors = response.get("errors") or []
+            if not any(error.get("type") == "RATE_LIMITED" for error in errors):
+                break
+            print("GitHub GraphQL rate limit hit, retrying...")
+            if headers.get("X-RateLimit-Remaining") != "0":
+                self.graphql_limiter.pause(SECONDARY_RATE_LIMIT_DELAY)
+
+        failures = [error for error in errors if error.get("type") != "NOT_FOUND"]
+        if failures:
+            raise RuntimeError(
+                "GitHub GraphQL query failed: "
+                + "; ".join(error.get("message", "") for error in failures)
+            )
+        return response.get("data") or {}
+
+
+async def get_public_org_members(client: GitHubClient, org_name: str) -> FrozenSet[str]:
     """Retrieves the public members of an organization.
 
     Args:
+        client: The GitHub API client.
         org_name: The name of the organization.
 
     Returns:
-        A list of the organization's public members.
+        A frozen set of the organization's public members.
     """
-    org = github_client.get_organization(org_name)
-    members = org.get_public_members()
-    return [member.login for member in members]
+    members = await client.get_all_pages(f"/orgs/{org_name}/public_members")
+    return frozenset(member["login"] for member in members)
 
 
-def get_public_source_repos(org_name: str) -> List:
+async def get_public_source_repos(
+    client: GitHubClient, org_name: str
+) -> List[Dict[str, any]]:
     """Retrieves the public repositories of an organization, excluding forks.
 
     Args:
+        client: The GitHub API client.
         org_name: The name of the organization.
 
     Returns:
         A list of the organization's public repositories that are not forks.
     """
-    org = github_client.get_organization(org_name)
-    repos = org.get_repos(type="public")
-    return [repo for repo in repos if not repo.fork and repo.name not in EXCLUDE_REPOS]
+    repos = await client.get_all_pages(f"/orgs/{org_name}/repos", {"type": "public"})
+    return [
+        repo for repo in repos if not repo["fork"] and repo["name"] not in EXCLUDE_REPOS
+    ]
 
 
-def get_contributions_between_dates(
-    repo: str, contributor_login: str, start_date: datetime, end_date: datetime
-) -> int:
-    """Retrieves the number of contributions for a contributor between the given start and end dates.
+def batched(items: List[str], size: int) -> Iterator[List[str]]:
+    """Splits a list into consecutive batches.
 
     Args:
-        repo: The repository object.
-        contributor_login: The login of the contributor.
-        start_date: The start date for the date range.
-        end_date: The end date for the date range.
+        items: The list to split.
+        size: The maximum size of each batch.
+
+    Yields:
+        Consecutive slices of the list with at most ``size`` items.
+    """
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+async def get_user_profiles(
+    client: GitHubClient, logins: List[str]
+) -> Dict[str, Dict[str, any]]:
+    """Retrieves the public profiles of the given users.
+
+    Note:
+        Up to ``GRAPHQL_BATCH_SIZE`` profiles are retrieved in a single GraphQL
+        query instead of one REST request per user.
+
+    Args:
+        client: The GitHub API client.
+        logins: The logins of the users.
+
+    Returns:
+        A dictionary mapping each login to its profile. Users that could not be
+        resolved are mapped to an empty dictionary.
+    """
+    profiles: Dict[str, Dict[str, any]] = {}
+
+    async def get_batch(batch: List[str]):
+        selections = " ".join(
+            f"u{i}: user(login: {orjson.dumps(login).decode()}) {{ name login "
+            "avatarUrl location company bio websiteUrl twitterUsername }"
+            for i, login in enumerate(batch)
+        )
+        data = await client.graphql(f"query {{ {selections} }}")
+        for i, login in enumerate(batch):
+            profiles[login] = data.get(f"u{i}") or {}
+
+    await asyncio.gather(
+        *[get_batch(batch) for batch in batched(logins, GRAPHQL_BATCH_SIZE)]
+    )
+    unresolved = [login for login, profile in profiles.items() if not profile]
+    if unresolved:
+        print(
+            f"Warning: Could not retrieve the profiles of {len(unresolved)} users, "
+            f"their profile fields will be empty: {', '.join(unresolved)}"
+        )
+    return profiles
+
+
+async def gql_batch_commit_counts(
+    client: GitHubClient,
+    repo: str,
+    node_ids: Dict[str, str],
+    since: datetime.datetime,
+) -> Dict[str, int]:
+    """Retrieves the number of commits of each contributor since the given date.
+
+    Note:
+        Counts for up to ``GRAPHQL_BATCH_SIZE`` contributors are retrieved in a
+        single GraphQL query instead of one REST request per contributor.
+
+    Args:
+        client: The GitHub API client.
+        repo: The full name of the repository (i.e. ``owner/name``).
+        node_ids: A dictionary mapping each contributor login to its GraphQL node
+            ID.
+        since: The start date for the count.
+
+    Returns:
+        A dictionary mapping each contributor login to its number of commits on the
+        default branch since the given date.
+    """
+    owner, name = repo.split("/", 1)
+    since_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+    counts = {login: 0 for login in node_ids}
+
+    async def count_batch(batch: List[str]):
+        selections = " ".join(
+            f"c{i}: defaultBranchRef {{ target {{ ... on Commit {{ "
+            f'history(since: "{since_str}", author: {{id: "{node_ids[login]}"}}) '
+            "{ totalCount } } } }"
+            for i, login in enumerate(batch)
+        )
+        data = await client.graphql(
+            f"query {{ repository(owner: {orjson.dumps(owner).decode()}, "
+            f"name: {orjson.dumps(name).decode()}) {{ {selections} }} }}"
+        )
+        repository = data.get("repository") or {}
+        for i, login in enumerate(batch):
+            branch = repository.get(f"c{i}")  # None for empty repositories.
+            if branch:
+                counts[login] = branch["target"]["history"]["totalCount"]
+
+    await asyncio.gather(
+        *[count_batch(batch) for batch in batched(list(node_ids), GRAPHQL_BATCH_SIZE)]
+    )
+    return counts
+
+
+async def get_contributor_stats(
+    client: GitHubClient, repo: str
+) -> Optional[List[Dict[str, any]]]:
+    """Retrieves the weekly commit activity of the contributors of a repository.
+
+    Note:
+        GitHub computes these statistics in the background and answers with
+        ``202 Accepted`` until they are ready, so the request is retried with
+        exponential backoff.
+
+    Args:
+        client: The GitHub API client.
+        repo: The full name of the repository (i.e. ``owner/name``).
 
     Returns:
-        The number of contributions between the given dates.
+        A list containing the total and weekly commit counts of each contributor,
+        or ``None`` if GitHub did not finish computing them in time.
     """
-    commits = repo.get_commits(
-        author=contributor_login, since=start_date, until=end_date
+    for attempt in range(STATS_MAX_RETRIES):
+        stats, _ = await client.get(f"/repos/{repo}/stats/contributors")
+        if not isinstance(stats, dict):
+            return stats or []
+        if attempt < STATS_MAX_RETRIES - 1:
+            await asyncio.sleep(2**attempt)
+    print(
+        f"Warning: GitHub is still computing the contributor statistics of {repo}. "
+        "Yearly contributions of its contributors are counted from the commit "
+        "history instead."
     )
-    return commits.totalCount
+    return None
+
+
+def is_bot(login: str, account_type: str) -> bool:
+    """Checks whether a contributor is a bot account.
+
+    Args:
+        login: The login of the contributor.
+        account_type: The GitHub account type of the contributor.
+
+    Returns:
+        Whether the contributor is a bot.
+    """
+    login_lower = login.lower()
+    return (
+        account_type == "Bot"
+        or login_lower.endswith("[bot]")
+        or login_lower in BOT_ACCOUNTS
+    )
+
 
+def load_repo_snapshot(cache_path: str) -> Optional[Dict[str, any]]:
+    """Loads a cached repository snapshot.
 
-def get_contributor_attr(obj, name: str, default: str = "") -> str:
-    """Safely retrieves an attribute from a PyGithub object."""
+    Args:
+        cache_path: The path of the snapshot.
+
+    Returns:
+        The snapshot, or ``None`` if it does not exist, cannot be read or was
+        written in an older format.
+    """
     try:
-        return getattr(obj, name)
-    except GithubException:
-        return default
+        with open(cache_path, "rb") as f:
+            snapshot = orjson.loads(f.read())
+        if (
+            snapshot.get("version") != REPO_CACHE_VERSION
+            or "pushed_at" not in snapshot
+            or not all(
+                REPO_SNAPSHOT_KEYS <= contributor.keys()
+                for contributor in snapshot["contributors"]
+            )
+        ):
+            return None
+        return snapshot
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError, AttributeError):
+        print(f"Warning: Ignoring unreadable repository snapshot {cache_path}")
+        return None
+
+
+async def get_repo_contributions(
+    client: GitHubClient, repo: Dict[str, any], since: datetime.datetime
+) -> List[Dict[str, any]]:
+    """Retrieves the non-bot contributors of a repository and their contributions.
+
+    Note:
+        Total contributions of every contributor are taken from the contributors
+        list. Yearly contributions are taken from the weekly contributor statistics
+        of the repository, which are retrieved in a single request. Contributors
+        missing from these statistics (e.g. beyond its contributor cap) are counted
+        from the default branch history instead, which unlike the statistics also
+        includes merge commits. The weekly counts are cached on disk and reused as long as nothing was pushed to the repository
+        since they were retrieved.
+
+    Args:
+        client: The GitHub API client.
+        repo: The repository as returned by the GitHub REST API.
+        since: The start date for the yearly contributions.
+
+    Returns:
+        A list of dictionaries containing the login, the avatar URL, the number of
+        contributions and the number of contributions since the given date of each
+        contributor.
+    """
+    since_timestamp = since.timestamp()
+    cache_path = os.path.join(
+        REPO_CACHE_DIR, f"{repo['full_name'].replace('/', '_')}.json"
+    )
+    cached = load_repo_snapshot(cache_path)
+    if (
+        cached
+        and repo["pushed_at"]
+        and cached["pushed_at"]
+        and cached["pushed_at"] >= repo["pushed_at"]
+    ):
+        contributors = cached["contributors"]
+        print(f"Using cached contributors info for {repo['name']}")
+    else:
+        repo_contributors, stats = await asyncio.gather(
+            client.get_all_pages(f"/repos/{repo['full_name']}/contributors"),
+            get_contributor_stats(client, repo["full_name"]),
+        )
+        stats_by_login = {
+            row["author"]["login"]: row for row in stats or [] if row["author"]
+        }
+        contributors = []
+        for contributor in repo_contributors:
+            row = stats_by_login.get(contributor["login"])
+            contributors.append(
+                {
+                    "login": contributor["login"],
+                    "type": contributor.get("type", ""),
+                    "node_id": contributor.get("node_id"),
+                    "avatar_url": contributor.get("avatar_url"),
+                    "contributions": contributor["contributions"],
+                    "weeks": (
+                        [
+                            {"w": week["w"], "c": week["c"]}
+                            for week in row["weeks"]
+                            if week["c"] and week["w"] >= since_timestamp
+                        ]
+                        if row
+                        else None  # Missing from the statistics.
+                    ),
+                }
+            )
+        if stats is not None:
+            save_to_json(
+                {
+                    "version": REPO_CACHE_VERSION,
+                    "pushed_at": repo["pushed_at"],
+                    "contributors": contributors,
+                },
+                cache_path,
+            )
+        print(f"Retrieved contributors info for {repo['name']}")
+
+    contributors = [
+        contributor
+        for contributor in contributors
+        if not is_bot(contributor["login"], contributor["type"])
+    ]
+    uncounted = {
+        contributor["login"]: contributor["node_id"]
+        for contributor in contributors
+        if contributor["weeks"] is None
+    }
+    history_counts = {}
+    if uncounted:
+        print(
+            f"Counting yearly commits of {len(uncounted)} contributors missing from "
+            f"the statistics of {repo['name']} from its commit history..."
+        )
+        history_counts = await gql_batch_commit_counts(
+            client, repo["full_name"], uncounted, since
+        )
+
+    return [
+        {
+            "login": contributor["login"],
+            "avatar_url": contributor.get("avatar_url"),
+            "contributions": contributor["contributions"],
+            "yearly_contributions": (
+                history_counts[contributor["login"]]
+                if contributor["weeks"] is None
+                else sum(
+                    week["c"]
+                    for week in contributor["weeks"]
+                    if week["w"] >= since_timestamp
+                )
+            ),
+        }
+        for contributor in contributors
+    ]
 
 
-def get_org_contributors_info(org_name: str) -> List[Dict[str, any]]:
+async def get_org_contributors_info(
+    client: GitHubClient, org_name: str
+) -> List[Dict[str, any]]:
     """Retrieves information about organization contributors.
 
     Args:
+        client: The GitHub API client.
         org_name (str): The name of the organization.
 
     Returns:
         A list of dictionaries containing contributor information.
     """
     print("Retrieving public organization members...")
-    public_members = get_public_org_members(org_name)
+    public_members = await get_public_org_members(client, org_name)
     print(f"Public members: {len(public_members)}")
     print("Retrieving public repositories...")
-    public_repos = get_public_source_repos(org_name)
+    public_repos = await get_public_source_repos(client, org_name)
     print(f"Public repositories: {len(public_repos)}")
 
     # Get contributors info.
-    end_date = datetime.datetime.now()
+    end_date = datetime.datetime.now(datetime.timezone.utc)
     start_date = end_date - datetime.timedelta(days=365)
-    contributors_info: Dict[str, ContributorInfo] = {}
     print("Retrieving contributors info...")
-    for repo in public_repos:
-        for contributor in repo.get_contributors():
-            login = contributor.login
-            login_lower = login.lower()
-            if (
-                getattr(contributor, "type", "") == "Bot"
-                or login_lower.endswith("[bot]")
-                or login_lower in BOT_ACCOUNTS
-            ):
-                continue  # Skip bot contributors
+    repo_contributions = await asyncio.gather(
+        *[get_repo_contributions(client, repo, start_date) for repo in public_repos]
+    )
+    logins = {
+        contributor["login"]
+        for contributors in repo_contributions
+        for contributor in contributors
+    }
+    profiles = await get_user_profiles(client, sorted(logins))
+
+    contributors_info: Dict[str, ContributorInfo] = {}
+    for contributors in repo_contributions:
+        for contributor in contributors:
+            login = contributor["login"]
             if login not in contributors_info:
-                contributors_info[contributor.login] = ContributorInfo(
+                profile = profiles[login]
+                contributors_info[login] = ContributorInfo(
                     login=login,
-                    name=get_contributor_attr(contributor, "name"),
-                    avatar_url=get_contributor_attr(contributor, "avatar_url"),
-                    location=get_contributor_attr(contributor, "location"),
-                    company=get_contributor_attr(contributor, "company"),
-                    bio=get_contributor_attr(contributor, "bio"),
-                    blog_url=get_contributor_attr(contributor, "blog"),
-                    twitter_username=get_contributor_attr(
-                        contributor, "twitter_username"
-                    ),
+                    name=profile.get("name"),
+                    avatar_url=profile.get("avatarUrl") or contributor["avatar_url"],
+                    location=profile.get("location"),
+                    company=profile.get("company"),
+                    bio=profile.get("bio"),
+                    blog_url=profile.get("websiteUrl"),
+                    twitter_username=profile.get("twitterUsername"),
                     org_member=login in public_members,
                 )
 
             contributors_info[login].add_contributions(
-                contributions=contributor.contributions
-            )
-            yearly_contributions = get_contributions_between_dates(
-                repo, login, start_date, end_date
+                contributions=contributor["contributions"]
             )
             contributors_info[login].add_yearly_contributions(
-                yearly_contributions
+                contributions=contributor["yearly_contributions"]
             )
-        print(f"Retrieved contributors info for {repo.name}")
 
     # Sort contributors by contribution count and return.
     sorted_contributors = sorted(
         contributors_info.values(), key=lambda c: c.contributions, reverse=True
     )
-    return [contributor.to_dict() for contributor in sorted_contributors]
+    return [dataclasses.asdict(contributor) for contributor in sorted_contributors]
 
 
-if __name__ == "__main__":
+async def main():
+    """Retrieves the organization contributors info and saves it to a JSON file."""
     print(f"Retrieving contributors info for {ORG_NAME} organisation...")
-    contributors_info = get_org_contributors_info(ORG_NAME)
-
     file_path = os.path.join(FILE_DIR, "assets/contributors_info.json")
+    async with GitHubClient(GITHUB_TOKEN) as client:
+        contributors_info = await get_org_contributors_info(client, ORG_NAME)
+
     save_to_json(contributors_info, file_path)
     print(f"Saved contributors info to {file_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,33 +2,69 @@
 stores them in a JSON file so we can showcase them in the contributors spotlight.
 """
 
-import json
 import os
 import sys
+import tempfile
 from typing import Any, Dict, List
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 FILE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]
+        ),
+    ),
+)
+
 
 def save_to_json(data: List[Dict[str, Any]], filename: str):
     """Saves data to a JSON file.
 
+    Note:
+        The data is written to a temporary file that then replaces the target, so
+        an interrupted run never leaves a truncated file behind.
+
     Args:
         data: The data to save.
         filename: The name of the file to save the data to.
     """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
+    content = memoryview(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+    fd, tmp_filename = tempfile.mkstemp(dir=os.path.dirname(filename))
+    try:
+        try:
+            os.fchmod(fd, 0o644)
+            while content:
+                content = content[os.write(fd, content) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        os.unlink(tmp_filename)
+        raise
 
 
-if __name__ == "__main__":
+def main():
+    """Stores the orchestrators with a GitHub account in a JSON file."""
     print("Fetching orchestrators with GitHub accounts...")
     # Fetch orchestrator profile data.
-    response = requests.get("https://explorer.livepeer.org/api/ens-data")
-    data = response.json()
+    response = SESSION.get(
+        "https://explorer.livepeer.org/api/ens-data",
+        timeout=(3, 30),
+        headers={"Accept-Encoding": "gzip"},
+    )
+    data = orjson.loads(response.content)
 
     if not isinstance(data, list):
         print("Invalid response from the ens-data API. Exiting...")
@@ -37,16 +73,20 @@ if __name__ == "__main__":
     # Only keep orchestrators with a GitHub account.
     filtered_data = [
         {
-            "github": item["github"],
+            "github": github,
             "profile_url": (
                 f"https://explorer.livepeer.org/accounts/{item['id']}/orchestrating"
             ),
         }
         for item in data
-        if item.get("github") and item["github"].strip() != ""
+        if (github := (item.get("github") or "").strip())
     ]
 
     # Save the filtered data to a JSON file.
     file_path = os.path.join(FILE_DIR, "assets/vip_contributors_info.json")
     save_to_json(filtered_data, file_path)
     print(f"Stored orchestrators with GitHub accounts in {file_path}")
+
+
+if __name__ == "__main__":
+    main()